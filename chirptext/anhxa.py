@@ -50,6 +50,9 @@ class DataObject(object):
         add_extra_fields(self, kwargs)
 
     def __getattr__(self, attr_name):
+        if attr_name.startswith('_DataObject__') or (attr_name.startswith('__') and attr_name.endswith('__')):
+            # internal data is not ready (e.g. while unpickling), or a special method lookup
+            raise AttributeError(attr_name)
         return self.__extra_data[attr_name] if attr_name in self.__extra_data else None
 
     def update(self, a_dict, *fields, **field_map):
@@ -103,7 +106,12 @@ def to_dict(obj, *fields, **field_map):
     """ Convert an object into a dictionary """
     if isinstance(obj, set):
         return list(obj)
-    obj_dict = obj.__dict__ if hasattr(obj, '__dict__') else obj
+    if hasattr(obj, '__dict__'):
+        obj_dict = obj.__dict__
+    elif hasattr(obj, '__slots__'):
+        obj_dict = {k: getattr(obj, k) for k in obj.__slots__}
+    else:
+        obj_dict = obj
     if not fields:
         fields = obj_dict.keys()
     json_dict = {field(k, field_map): obj_dict[k] for k in fields}
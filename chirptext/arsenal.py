@@ -14,6 +14,7 @@ import logging
 import sqlite3
 import zlib
 
+from . import chio
 from .leutile import FileHelper
 
 
@@ -29,8 +30,8 @@ class JiCache:
     """ Cache textual/binary content using an SQLite file (with internal blob or an external folder)
     """
     def __init__(self, location, blob_location=None, use_internal_blob=True):
-        self.location = os.path.abspath(os.path.expanduser(location))
-        self.blob_location = os.path.abspath(os.path.expanduser(blob_location)) if blob_location else self.location + '.blob'
+        self.location = FileHelper.abspath(location)
+        self.blob_location = FileHelper.abspath(blob_location) if blob_location else self.location + '.blob'
         self.use_internal_blob = use_internal_blob
         logger = getLogger()
         logger.info("Cache DB location    : {location}".format(location=self.location))
@@ -41,7 +42,12 @@ class JiCache:
         # self.setup()
 
     def setup(self):
-        if not os.path.isfile(self.location) or os.path.getsize(self.location) == 0:
+        # setup() runs for every connection, so check the DB file with a single stat() call
+        try:
+            is_empty = os.path.getsize(self.location) == 0
+        except OSError:
+            is_empty = True  # DB file does not exist yet
+        if is_empty:
             getLogger().debug("Setting up DB")
             # create dir to store blobs
             if not self.use_internal_blob:
@@ -220,7 +226,7 @@ class JiCache:
                 blob_key = str(uuid.uuid1())
                 blob_file = os.path.join(self.blob_location, blob_key)
                 # try to write BLOB content to file
-            FileHelper.save(blob_file, blob)
+            chio.write_file(blob_file, blob)
             if not self.__insert(key, blob_key):
                 # Cannot insert key, delete the file
                 os.unlink(blob_file)
@@ -241,7 +247,8 @@ class JiCache:
         else:
             getLogger().debug("Key[{key}] -> [{blob_key}]".format(key=key, blob_key=blob_key))
             blob_file = os.path.join(self.blob_location, blob_key)
-            return FileHelper.read(blob_file)
+            blob_data = chio.read_file(blob_file, mode='rb')
+            return blob_data if not encoding else blob_data.decode(encoding)
 
     def delete_blob(self, key):
         blob_key = self.__retrieve(key)
@@ -109,20 +109,22 @@ def write_file(path, content, mode=None, encoding='utf-8'):
         raise ValueError("Output path is invalid")
     else:
         getLogger().debug("Writing content to {}".format(path))
+        newline = None
         # convert content to string when writing text data
         if mode in ('w', 'wt') and not isinstance(content, str):
             content = to_string(content)
         elif mode == 'wb':
-            # content needs to be encoded as bytes
-            if not isinstance(content, str):
+            if isinstance(content, str):
+                # let the text stream encode the content instead of creating an encoded copy first
+                mode = 'wt'
+                newline = ''  # binary output must not translate line endings
+            elif not isinstance(content, bytes):
                 content = to_string(content).encode(encoding)
-            else:
-                content = content.encode(encoding)
-        if str(path).endswith('.gz'):
-            with gzip.open(path, mode) as outfile:
+        if mode.endswith('b'):
+            with open(path, mode=mode) as outfile:
                 outfile.write(content)
         else:
-            with open(path, mode=mode) as outfile:
+            with open(path, mode=mode, encoding=encoding, newline=newline) as outfile:
                 outfile.write(content)
 
 
@@ -10,6 +10,8 @@ Miscellaneous tools for text processing
 
 import os
 import io
+import re
+import math
 import logging
 import sys
 import time
@@ -19,9 +21,12 @@ import configparser
 import warnings
 from collections import Counter as PythonCounter
 from collections import OrderedDict
+from collections import defaultdict as dd
+from functools import lru_cache
 
-from itertools import zip_longest
+from itertools import zip_longest, islice
 
+from . import chio
 from .chio import read_file, write_file
 
 
@@ -33,17 +38,26 @@ def getLogger():
     return logging.getLogger(__name__)
 
 
+# same grammar as float() minus nan, so that is_number() does not rely on raising exceptions
+_NUMBER_DIGITS = r"\d(?:_?\d)*"
+_NUMBER_PATTERN = re.compile(r"\s*[+-]?(?:(?:{d}(?:\.(?:{d})?)?|\.{d})(?:[eE][+-]?{d})?|inf(?:inity)?)\s*".format(d=_NUMBER_DIGITS),
+                             re.IGNORECASE)
+
 LOREM_IPSUM = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum."
 
 
 ###############################################################################
 
+_YES = frozenset(('y', 'yes', 'ok'))
+
+
 def confirm(msg):
-    return input(msg).upper() in ['Y', 'YES', 'OK']
+    return input(msg).strip().casefold() in _YES
 
 
 def uniquify(a_list):
-    return list(OrderedDict(zip(a_list, range(len(a_list)))).keys())
+    """ Remove duplicated items from a list while keeping the first-seen order (items must be hashable) """
+    return list(dict.fromkeys(a_list))
 
 
 def hamilton_allocate(numbers, total=100, precision=2):
@@ -72,37 +86,42 @@ def hamilton_allocate(numbers, total=100, precision=2):
     return [n[0] / scale for n in floored]
 
 
+_HEADER_BOX = '+' + '-' * (80 + 2)
+_HEADER_H1 = '-' * 60
+_HEADER_H2 = '\t' + ('-' * 40)
+_HEADER_H3 = '\t\t' + ('-' * 20)
+
+
 def header(*msg, level='h1', separator=" ", print_out=print):
     """ Print header block in text mode
     """
     out_string = separator.join(str(x) for x in msg)
     if level == 'h0':
-        # box_len = 80 if len(msg) < 80 else len(msg)
-        box_len = 80
-        print_out('+' + '-' * (box_len + 2))
+        print_out(_HEADER_BOX)
         print_out("| %s" % out_string)
-        print_out('+' + '-' * (box_len + 2))
+        print_out(_HEADER_BOX)
     elif level == 'h1':
         print_out("")
         print_out(out_string)
-        print_out('-' * 60)
+        print_out(_HEADER_H1)
     elif level == 'h2':
         print_out('\t%s' % out_string)
-        print_out('\t' + ('-' * 40))
+        print_out(_HEADER_H2)
     else:
         print_out('\t\t%s' % out_string)
-        print_out('\t\t' + ('-' * 20))
+        print_out(_HEADER_H3)
 
 
 def is_number(s):
     """ Check if something is a number
     """
+    if isinstance(s, str):
+        return _NUMBER_PATTERN.fullmatch(s) is not None
     try:
-        if str(float(s)) != 'nan':
-            return True
+        value = float(s)
     except Exception:
-        pass
-    return False
+        return False
+    return value == value  # NaN is the only float that is not equal to itself
 
 
 def grouper(iterable, n, fillvalue=None):
@@ -110,6 +129,15 @@ def grouper(iterable, n, fillvalue=None):
     return zip_longest(fillvalue=fillvalue, *args)
 
 
+def chunked(iterable, n):
+    """ Split an iterable into lists of n items, the last list may be shorter (no fill values) """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, n))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, n))
+
+
 ###############################################################################
 
 class Value(object):
@@ -165,57 +193,70 @@ class piter(object):
 class Counter(PythonCounter):
     """ Powerful counter class
     """
+    _EMPTY = ()  # shared priority for counters without report order
+
     def __init__(self, priority=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__priority = priority if priority else []
+        self.__priority = tuple(priority) if priority else Counter._EMPTY
 
     def count(self, key):
-        self.update({key})
+        self[key] = self.get(key, 0) + 1
 
     @property
     def priority(self):
-        return list(self.__priority)
+        """ Keys to be reported first (read-only tuple, assign a new sequence to change it) """
+        return self.__priority
 
     @priority.setter
     def priority(self, priority):
-        self.priority = list(priority)
+        self.__priority = tuple(priority) if priority else Counter._EMPTY
 
     def get_report_order(self):
         """ Keys are sorted based on report order (i.e. some keys to be shown first)
-            Related: see sorted_by_count
+            Related: see most_common() for sorting by frequency
         """
-        order_list = []
-        for x in self.__priority:
-            order_list.append([x, self[x]])
-        for x in sorted(list(self.keys())):
-            if x not in self.__priority:
-                order_list.append([x, self[x]])
+        order_list = [[x, self[x]] for x in self.__priority]
+        if self.__priority:
+            priority_set = set(self.__priority)
+            order_list.extend([x, self[x]] for x in sorted(self.keys()) if x not in priority_set)
+        else:
+            order_list.extend([x, self[x]] for x in sorted(self.keys()))
         return order_list
 
     def summarise(self, report=None, byfreq=True, limit=None):
         if not report:
             report = TextReport()
-        items = self.most_common() if byfreq else self.get_report_order()
-        if limit:
-            items = items[:limit]
-        for k, v in items:
-            report.writeline("%s: %d" % (k, v))
+        if byfreq:
+            # most_common(n) picks the top n items without sorting the whole counter
+            items = self.most_common(limit if limit else None)
+        else:
+            items = self.get_report_order()
+            if limit:
+                items = items[:limit]
+        lines = ["%s: %d" % (k, v) for k, v in items]
+        if isinstance(report, TextReport) and type(report).writeline is TextReport.writeline:
+            report.writelines(lines)  # one call to the output stream, unless writeline was overridden
+        else:
+            for line in lines:
+                report.writeline(line)
 
     def group_by_count(self):
-        d = OrderedDict()
-        for item, count in self.most_common():
-            if count not in d:
-                d[count] = []
-            d[count].append(item)
-        return d.items()
+        groups = dd(list)
+        for item, count in self.items():
+            groups[count].append(item)
+        # only the distinct counts need sorting, items in each group keep their insertion order
+        return {count: groups[count] for count in sorted(groups, reverse=True)}.items()
+
+
+_now = time.perf_counter  # monotonic, high resolution clock for measuring elapsed time
 
 
 class Timer:
     """ Measure tasks' runtime
     """
     def __init__(self, logger=None, report=None):
-        self.start_time = time.time()
-        self.end_time = time.time()
+        self.start_time = _now()
+        self.end_time = _now()
         self.__logger = logger
         self.__report = report
         self.end = self.stop  # just an alias
@@ -237,11 +278,11 @@ class Timer:
 
     def start(self, desc=''):
         self.log("Started", desc=desc)
-        self.start_time = time.time()
+        self.start_time = _now()
         return self
 
     def stop(self, desc=''):
-        self.end_time = time.time()
+        self.end_time = _now()
         msg = "[{} | {}]".format(desc, str(self)) if desc else str(self)
         self.log("Stopped", desc=msg)
         return self
@@ -257,6 +298,14 @@ class Timer:
 
 ###############################################################################
 
+# detokenize rewriting rules, order matters as each rule sees the output of the previous ones
+_DETOKENIZE_RULES = ((" , , ", ", "), (' , ', ', '), ('“ ', '“'), (' ”', '”'),
+                     (' ! ', '! '), (" 'll ", "'ll "), (" 've ", "'ve "), (" 're ", "'re "), (" 'd ", "'d "),
+                     (" 's ", "'s "), (" 'm ", "'m "), (" ' ", "' "), (" ; ", "; "), (" : ", ": "),
+                     ("( ", "("), (" )", ")"), (" ?", "?"), (" n't ", "n't "), ("  ", " "),
+                     ('``', "“"), ("''", "”"), ("“ ", "“"), (" ”", "”"))
+
+
 class StringTool:
     """ Common string function
     """
@@ -271,22 +320,9 @@ class StringTool:
     @staticmethod
     def detokenize(tokens):
         sentence_text = ' '.join(tokens)
-        sentence_text = sentence_text.replace(" , , ", ", ")
-        sentence_text = sentence_text.replace(' , ', ', ').replace('“ ', '“').replace(' ”', '”')
-        sentence_text = sentence_text.replace(' ! ', '! ').replace(" 'll ", "'ll ").replace(" 've ", "'ve ").replace(" 're ", "'re ").replace(" 'd ", "'d ")
-        sentence_text = sentence_text.replace(" 's ", "'s ")
-        sentence_text = sentence_text.replace(" 'm ", "'m ")
-        sentence_text = sentence_text.replace(" ' ", "' ")
-        sentence_text = sentence_text.replace(" ; ", "; ")
-        sentence_text = sentence_text.replace(" : ", ": ")
-        sentence_text = sentence_text.replace("( ", "(")
-        sentence_text = sentence_text.replace(" )", ")")
-        sentence_text = sentence_text.replace(" ?", "?")
-        sentence_text = sentence_text.replace(" n't ", "n't ")
-        sentence_text = sentence_text.replace("  ", " ")
-        sentence_text = sentence_text.replace('``', "“").replace("''", "”")
-        sentence_text = sentence_text.replace("“ ", "“").replace(" ”", "”")
-        if sentence_text[-2:] in (' .', ' :', ' ?', ' !', " ;"):
+        for old, new in _DETOKENIZE_RULES:
+            sentence_text = sentence_text.replace(old, new)
+        if len(sentence_text) > 1 and sentence_text[-2] == ' ' and sentence_text[-1] in '.:?!;':
             sentence_text = sentence_text[:-2] + sentence_text[-1]
         sentence_text = sentence_text.strip()
         return sentence_text
@@ -294,6 +330,19 @@ class StringTool:
 
 ###############################################################################
 
+_INDENTS = tuple("\t" * i for i in range(32))
+
+
+def _indent(level):
+    """ [Internal] Get the indentation string of a given level """
+    return _INDENTS[level] if 0 <= level < 32 else "\t" * level
+
+
+def _format_msg(msg, separator=" ", level=0):
+    """ [Internal] Join message parts into an indented string """
+    return _indent(level) + separator.join(str(x) for x in msg)
+
+
 class TextReport:
 
     STDOUT = '*stdout*'
@@ -301,12 +350,14 @@ class TextReport:
 
     """ Helper for creating text report with indentation, tables and flexible output (to stdout or a file)
     """
-    def __init__(self, path=None, mode='w', name=None, auto_flush=True, encoding='utf8'):
+    def __init__(self, path=None, mode='w', name=None, auto_flush=False, encoding='utf8', buffering=-1):
         """ Create a text report.
 
         Arguments:
             report_path -- Path to report file
             mode        -- a for append, w (default) for create from scratch (overwrite existing file)
+            auto_flush  -- flush file output after every write (off by default, use flush() when needed)
+            buffering   -- buffer size for file output, -1 (default) to use the system default
         """
         if not path or path == TextReport.STDOUT:
             self.__path = TextReport.STDOUT
@@ -323,10 +374,10 @@ class TextReport:
         else:
             if path == '/dev/null':
                 self.__path = '/dev/null'
-                self.__report_file = open(os.devnull, mode=mode, encoding=encoding)
+                self.__report_file = open(os.devnull, mode=mode, encoding=encoding, buffering=buffering)
             else:
                 self.__path = os.path.expanduser(path)
-                self.__report_file = open(self.__path, mode, encoding=encoding)
+                self.__report_file = open(self.__path, mode, encoding=encoding, buffering=buffering)
             self.name = name if name else FileHelper.getfilename(self.__path)
             self.auto_flush = auto_flush
             self.mode = mode
@@ -353,19 +404,30 @@ class TextReport:
             return ''
 
     def write(self, *msg, separator=" ", level=0):
-        out_string = separator.join(str(x) for x in msg)
-        self.__report_file.write("\t" * level)
-        self.__report_file.write(out_string)
+        self.__report_file.write(_format_msg(msg, separator, level))
         if self.auto_flush:
             self.__report_file.flush()
 
-    def writeline(self, *msg, **kwargs):
-        self.write(*msg, **kwargs)
-        self.write('\n')
+    def writeline(self, *msg, separator=" ", level=0):
+        self.__report_file.write(_format_msg(msg, separator, level) + '\n')
+        if self.auto_flush:
+            self.__report_file.flush()
+
+    def writelines(self, lines, level=0):
+        """ Write each item of an iterable as a line using a single call to the output stream """
+        indent = _indent(level)
+        self.__report_file.writelines([indent + str(line) + '\n' for line in lines])
+        if self.auto_flush:
+            self.__report_file.flush()
 
     def header(self, *msg, **kwargs):
         header(*msg, print_out=self.writeline, **kwargs)
 
+    def flush(self):
+        """ Flush buffered content to the output stream """
+        if self.__report_file is not None:
+            self.__report_file.flush()
+
     def close(self):
         if self.mode and self.__report_file != sys.stdout:
             try:
@@ -401,6 +463,8 @@ class TextReport:
 class FileHub:
     """ A helper class for working with multiple text reports at the same time
     """
+    BUFFER_SIZE = 1 << 16  # larger buffer as reports often emit many short lines
+
     def __init__(self, *filenames, working_dir='.', default_mode='a', ext='txt'):
         self.files = {}
         self.ext = ext if ext else ''
@@ -408,9 +472,8 @@ class FileHub:
         self.default_mode = default_mode
 
     def __getitem__(self, key):
-        if key not in self.files:
-            self.open(key)
-        return self.files[key]
+        report = self.files.get(key)
+        return report if report is not None else self.open(key)
 
     def __setitem__(self, key, value):
         self.files[key] = value
@@ -424,12 +487,27 @@ class FileHub:
     def open(self, key, mode=None, **kwargs):
         if not mode:
             mode = self.default_mode
+        kwargs.setdefault('buffering', FileHub.BUFFER_SIZE)
         self.files[key] = TextReport(self.get_path(key), mode=mode, **kwargs)
         return self.files[key]
 
+    def writeline(self, key, *msg, **kwargs):
+        """ Write a line to the report named key (open it if needed) """
+        self[key].writeline(*msg, **kwargs)
+
+    def flush(self):
+        """ Flush all opened reports """
+        for report in self.files.values():
+            report.flush()
+
     def close(self):
-        for key in self.files.keys():
-            self[key].close()
+        for report in self.files.values():
+            try:
+                report.close()
+            except Exception:
+                # keep closing the other reports so that no file handle is leaked
+                getLogger().exception("Could not close report [%s]" % (report.path,))
+        self.files.clear()
 
     def __enter__(self):
         return self
@@ -451,44 +529,54 @@ class Table:
         self.header = header
         self.padding = padding
 
-    def maxlength(self, val_a, val_b):
-        len_a = len(val_a) if val_a else 0
-        len_b = len(val_b) if val_b else 0
-        return len_a if len_a > len_b else len_b
-
     def add_row(self, new_row):
         if new_row is None:
             raise ValueError("Row cannot be None")
+        new_row = list(new_row)  # clone a list, rather than store the ref passed in
         if len(new_row) > self.col_count:
-            self.col_count = len(new_row)  # longer row
+            # longer row, pad existing rows with the same filler list
+            padding = [self.NoneValue] * (len(new_row) - self.col_count)
+            self.col_count = len(new_row)
             for row in self.rows:
-                # add cell
-                row += [self.NoneValue] * (len(new_row) - self.col_count)
+                row.extend(padding)
         elif len(new_row) < self.col_count:
-            new_row += [self.NoneValue] * (self.col_count - len(new_row))
-        self.rows.append(list(new_row))  # clone a list, rather than store the ref passed in
+            new_row.extend([self.NoneValue] * (self.col_count - len(new_row)))
+        self.rows.append(new_row)
 
     def __getitem__(self, row_id):
-        return list(self.rows[row_id])    # clone a row to return
+        """ Get a row of this table (the stored list is returned, use get_row_copy() to get a modifiable copy) """
+        return self.rows[row_id]
+
+    def get_row_copy(self, row_id):
+        """ Get a copy of a row which can be modified without affecting the table """
+        return list(self.rows[row_id])
 
     def get_column(self, col_id):
-        return [x[col_id] if x[col_id] is not None else self.NoneValue for x in self.rows]
+        column = [x[col_id] for x in self.rows]
+        if self.NoneValue is None:
+            return column
+        none_value = self.NoneValue
+        return [v if v is not None else none_value for v in column]
 
     def format(self):
         """ Format table to print out
         """
-        self.max_lengths = []
-        for row in self.rows:
-            if len(self.max_lengths) < len(row):
-                self.max_lengths += [0] * (len(row) - len(self.max_lengths))
-            for idx, val in enumerate(row):
-                len_cell = len(str(val)) if val else 0
-                if self.max_lengths[idx] < len_cell:
-                    self.max_lengths[idx] = len_cell
+        self._format_rows()
         return self.max_lengths
 
+    def _format_rows(self):
+        """ [Internal] Convert all cells to strings (None becomes an empty cell) and update column widths """
+        str_rows = [['' if val is None else str(val) for val in row] for row in self.rows]
+        self.max_lengths = [max(map(len, column), default=0) for column in zip_longest(*str_rows, fillvalue='')]
+        return str_rows
+
+    def _separator_cells(self):
+        """ [Internal] Separator cells for the current column widths """
+        extra = 2 if self.padding else 0
+        return ['-' * (x + extra) for x in self.max_lengths]
+
     def print_separator(self, print_func):
-        self.print_cells(['-' * (x + (2 if self.padding else 0)) for x in self.max_lengths], print_func, joint='+')
+        self.print_cells(self._separator_cells(), print_func, joint='+')
 
     def print_cells(self, cells, print_func=None, extra_lines=False, joint='|'):
         if print_func is None:
@@ -499,21 +587,27 @@ class Table:
             self.print_separator(print_func)
 
     def print(self, print_func=print):
-        max_lengths = self.format()
+        if print_func is None:
+            print_func = print
+        str_rows = self._format_rows()
+        max_lengths = self.max_lengths
+        padding = self.padding
         self.print_separator(print_func)
-        for ridx, row in enumerate(self.rows):
-            cells = []
-            for idx, cell in enumerate(row):
-                txt = str(cell)
-                cell_width = max_lengths[idx]
-                if ridx == 0 and self.header:
-                    txt = txt.center(cell_width)
+        rows = iter(str_rows)
+        if self.header:
+            for row in rows:
+                # only the first row is the header row
+                if padding:
+                    cells = [' ' + cell.center(width) + ' ' for cell, width in zip(row, max_lengths)]
                 else:
-                    txt = txt.rjust(cell_width) if is_number(txt) else txt.ljust(cell_width)
-                if self.padding:
-                    txt = ' ' + txt + ' '
-                cells.append(txt)
-            self.print_cells(cells, print_func, extra_lines=(self.header and ridx == 0))
+                    cells = [cell.center(width) for cell, width in zip(row, max_lengths)]
+                self.print_cells(cells, print_func, extra_lines=True)
+                break
+        # one format string per column and alignment, numbers are right-aligned
+        pad = ' ' if padding else ''
+        col_formats = [(pad + '{:<%d}' % width + pad, pad + '{:>%d}' % width + pad) for width in max_lengths]
+        for row in rows:
+            self.print_cells([fmt[is_number(cell)].format(cell) for cell, fmt in zip(row, col_formats)], print_func)
         self.print_separator(print_func)
 
 
@@ -521,6 +615,7 @@ class Table:
 
 class FileHelper:
     @staticmethod
+    @lru_cache(maxsize=1024)
     def getfilename(file_path):
         """ Get filename without extension
         """
@@ -574,20 +669,20 @@ class FileHelper:
     @staticmethod
     def get_child_folders(path):
         """ Get all child folders of a folder """
-        path = FileHelper.abspath(path)
-        return [dirname for dirname in os.listdir(path) if os.path.isdir(os.path.join(path, dirname))]
+        with os.scandir(FileHelper.abspath(path)) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
 
     @staticmethod
     def get_child_files(path):
         """ Get all child files of a folder """
-        path = FileHelper.abspath(path)
-        return [filename for filename in os.listdir(path) if os.path.isfile(os.path.join(path, filename))]
+        with os.scandir(FileHelper.abspath(path)) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
 
     @staticmethod
     def remove_file(filepath):
         """ Delete a file """
         try:
-            os.remove(os.path.abspath(os.path.expanduser(filepath)))
+            os.remove(os.path.expanduser(filepath))
         except OSError as e:
             if e.errno != errno.ENOENT:
                 raise
@@ -623,10 +718,9 @@ This class supports guessing configuration file location, and reads either INI (
         self.__name = name
         self.__mode = mode
         self.working_dir = working_dir
-        self.__potential = []
-        if extra_potentials:
-            self.add_potential(*extra_potentials)
-        self.add_potential(*AppConfig.LOC_TEMPLATE)
+        self.__patterns = list(extra_potentials) if extra_potentials else []
+        self.__patterns.extend(AppConfig.LOC_TEMPLATE)
+        self.__potential = None  # built from patterns on first use
         self.__config = None
         self.__config_path = None
 
@@ -636,17 +730,20 @@ This class supports guessing configuration file location, and reads either INI (
         return self.__config_path
 
     def potentials(self):
+        """ Potential config file locations (duplicates removed, in the order they were added) """
+        if self.__potential is None:
+            self.__potential = list(dict.fromkeys(ptn.format(wd=self.working_dir, n=self.__name, mode=self.__mode)
+                                                  for ptn in self.__patterns))
         return self.__potential
 
     def add_potential(self, *patterns):
         """ Add a potential config file pattern """
-        for ptn in patterns:
-            _p = ptn.format(wd=self.working_dir, n=self.__name, mode=self.__mode)
-            self.__potential.append(_p)
+        self.__patterns.extend(patterns)
+        self.__potential = None
 
     def locate_config(self):
         """ Locate config file """
-        for f in self.__potential:
+        for f in self.potentials():
             f = FileHelper.abspath(f)
             if os.path.isfile(f):
                 return f
@@ -687,7 +784,8 @@ This class supports guessing configuration file location, and reads either INI (
         """ Read a configuration file and return configuration data """
         getLogger().info("Loading app config from {} file: {}".format(self.__mode, file_path))
         if self.__mode == AppConfig.JSON:
-            return json.loads(read_file(file_path), object_pairs_hook=OrderedDict)
+            with chio.open(file_path) as infile:
+                return json.load(infile, object_pairs_hook=OrderedDict)
         elif self.__mode == AppConfig.INI:
             config = configparser.ConfigParser(allow_no_value=True)
             config.read(file_path)
@@ -9,8 +9,8 @@ Language profile: UK English
 # :license: MIT, see LICENSE for more details.
 
 import os
-import codecs
 import logging
+from functools import lru_cache
 
 # -------------------------------------------------------------------------------
 # Configuration
@@ -30,6 +30,8 @@ SWADESH_SIGN_PATH = os.path.join(MY_DATA, 'swadesh/sign.txt')
 
 class Word(object):
     """ Swadesh word """
+    __slots__ = ('ID', 'word', 'score', 'description', 'rank')
+
     def __init__(self, ID, word, score=0, description='', rank=0):
         self.ID = ID
         self.word = word
@@ -41,36 +43,58 @@ class Word(object):
         return "Word(ID={}, word={})".format(repr(self.ID), repr(self.word))
 
 
+def _iter_entries(path):
+    """ [Internal] Iterate through non-empty, non-comment lines of a data file """
+    with open(path, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            line = line.rstrip('\n')
+            if line and not line.startswith("#"):
+                yield line
+
+
+@lru_cache(maxsize=None)
+def _load_swadesh_1971():
+    """ [Internal] Parse Swadesh 1971 list once (data files are static) """
+    words = []
+    for idx, line in enumerate(_iter_entries(SWADESH_1971_PATH)):
+        row = line.split(maxsplit=1)
+        desc = row[1] if len(row) == 2 else ''
+        words.append(Word(ID=idx + 1, word=row[0], description=desc))
+    return tuple(words)
+
+
+@lru_cache(maxsize=None)
+def _load_swadesh_ranked():
+    """ [Internal] Parse ranked Swadesh list once """
+    words = []
+    for idx, line in enumerate(_iter_entries(SWADESH_RANKED_PATH)):
+        swid, top40, lemma, score = line.split()
+        words.append(Word(ID=swid, word=lemma, score=score, rank=idx + 1))
+    return tuple(words)
+
+
+@lru_cache(maxsize=None)
+def _load_swadesh_sign():
+    """ [Internal] Parse Swadesh list for sign languages once """
+    return tuple(Word(ID=idx + 1, word=line.strip()) for idx, line in enumerate(_iter_entries(SWADESH_SIGN_PATH)))
+
+
 def read_swadesh_1971():
-    with codecs.open(SWADESH_1971_PATH, 'r', encoding='utf-8') as infile:
-        lines = infile.read().splitlines()
-        table = [l.split(maxsplit=1) for l in lines if l and not l.startswith("#")]
-        words = []
-        for idx, row in enumerate(table):
-            desc = row[1] if len(row) == 2 else ''
-            word = Word(ID=idx + 1, word=row[0], description=desc)
-            words.append(word)
-        return words
+    """ Get Swadesh's final list (1971)
+        A new list is returned on each call but Word objects are shared, do not modify them
+    """
+    return list(_load_swadesh_1971())
 
 
 def read_swadesh_ranked():
-    with codecs.open(SWADESH_RANKED_PATH, 'r', encoding='utf-8') as infile:
-        lines = infile.read().splitlines()
-        table = [l.split() for l in lines if l and not l.startswith("#")]
-        words = []
-        for idx, row in enumerate(table):
-            swid, top40, lemma, score = row
-            word = Word(ID=swid, word=lemma, score=score, rank=idx + 1)
-            words.append(word)
-        return words
+    """ Get the ranked Swadesh-100 list
+        A new list is returned on each call but Word objects are shared, do not modify them
+    """
+    return list(_load_swadesh_ranked())
 
 
 def read_swadesh_sign():
-    with codecs.open(SWADESH_SIGN_PATH, 'r', encoding='utf-8') as infile:
-        lines = infile.read().splitlines()
-        table = [l for l in lines if l and not l.startswith("#")]
-        words = []
-        for idx, row in enumerate(table):
-            word = Word(ID=idx + 1, word=row.strip())
-            words.append(word)
-        return words
+    """ Get Swadesh list for sign languages
+        A new list is returned on each call but Word objects are shared, do not modify them
+    """
+    return list(_load_swadesh_sign())
@@ -13,7 +13,6 @@ import logging
 from collections import defaultdict as dd
 
 from . import chio
-from .anhxa import to_obj, to_dict
 
 
 # -------------------------------------------------------------------------------
@@ -43,6 +42,8 @@ class Radical(object):
     """ Chinese Radical
         Source: https://en.wikipedia.org/wiki/Kangxi_radical#Table_of_radicals
     """
+    __slots__ = tuple(KANGXI_FIELDS)
+
     def __init__(self, idseq='', radical='', variants='', strokes='', meaning='', pinyin='', hanviet='', hiragana='', romaji='', hangeul='', romaja='', frequency='', simplified='', examples=''):
         self.idseq = idseq
         self.radical = radical
@@ -66,15 +67,14 @@ class Radical(object):
         return "{}-{}[sc:{}]".format(self.radical, self.meaning, self.strokes)
 
     def to_dict(self):
-        return to_dict(self)
+        return {f: getattr(self, f) for f in KANGXI_FIELDS}
 
     __KANGXI_MAP = None
 
     @staticmethod
     def kangxi():
         if not Radical.__KANGXI_MAP:
-            kxs = chio.read_csv(KANGXI_FILE, fieldnames=True)
-            Radical.__KANGXI_MAP = KangxiMap(kxs)
+            Radical.__KANGXI_MAP = _read_kangxi(KANGXI_FILE)
         else:
             getLogger().debug("Kangxi has been loaded once. Created KangxiMap will be re-used")
         return Radical.__KANGXI_MAP
@@ -87,45 +87,79 @@ class KangxiMap:
         self.rad_map = {}     # kangxi.radical -> kangxi object
         self.id_rad_map = {}  # idseq ('1', '2', i.e. string) -> rad object
         self.strokes_map = dd(list)  # map strokes => radicals
+        self.__index = {}  # rad_map & id_rad_map merged (rad_map keys win) for single-lookup access
+        self.__all = None  # cached results of all & strokes, reset by add()
+        self.__strokes = None
         if rads:
             for rad in rads:
-                rad_obj = to_obj(Radical, rad)
-                rad_obj.frequency = int(rad_obj.frequency)
-                rad_obj.idseq = int(rad_obj.idseq)
-                rad_obj.strokes = int(rad_obj.strokes)
-                self.add(rad_obj)
+                # construct directly from known fields, unknown columns are ignored
+                self.add(_parse_numbers(Radical(**{f: rad[f] for f in KANGXI_FIELDS if f in rad})))
 
     @property
     def all(self):
-        return [r.radical for r in self.radicals]
+        """ All radicals (cached, do not modify the returned list) """
+        if self.__all is None:
+            self.__all = [r.radical for r in self.radicals]
+        return self.__all
 
     @property
     def strokes(self):
-        return {sc: [r.radical for r in rads] for sc, rads in self.strokes_map.items()}
+        """ Map stroke counts to radicals (cached, do not modify the returned dict) """
+        if self.__strokes is None:
+            self.__strokes = {sc: [r.radical for r in rads] for sc, rads in self.strokes_map.items()}
+        return self.__strokes
 
     def __len__(self):
         return len(self.radicals)
 
     def __getitem__(self, key):
-        if key in self.rad_map:  # literal matching
-            return self.rad_map[key]
-        elif key in self.id_rad_map:
-            return self.id_rad_map[key]
-        else:
-            return self.radicals[key]  # by list index
+        # literal matching first, then idseq
+        rad = self.__index.get(key)
+        return rad if rad is not None else self.radicals[key]  # by list index
 
     def __contains__(self, key):
-        return key in self.rad_map or key in self.id_rad_map
+        return key in self.__index
 
     def add(self, rad):
+        self.__all = None
+        self.__strokes = None
         self.radicals.append(rad)
         self.rad_map[rad.radical] = rad
-        self.id_rad_map[str(rad.idseq)] = rad
+        self.__index[rad.radical] = rad
+        sid = str(rad.idseq)
+        self.id_rad_map[sid] = rad
+        if sid not in self.rad_map:
+            self.__index[sid] = rad
         self.strokes_map[int(rad.strokes)].append(rad)
         # map variants & simplified
         if rad.variants:
             for v in rad.variants.split():
                 self.rad_map[v] = rad
+                self.__index[v] = rad
         if rad.simplified:
             for s in rad.simplified.split():
                 self.rad_map[s] = rad
+                self.__index[s] = rad
+
+
+def _parse_numbers(rad):
+    """ [Internal] Convert numeric fields of a radical read from text data """
+    rad.frequency = int(rad.frequency)
+    rad.idseq = int(rad.idseq)
+    rad.strokes = int(rad.strokes)
+    return rad
+
+
+def _read_kangxi(path):
+    """ [Internal] Read a KangxiMap from a tab-separated file """
+    rows = chio.read_tsv_iter(path)
+    header = next(rows, None)
+    if header != KANGXI_FIELDS:
+        # unexpected columns, map values by column names instead
+        rows.close()
+        return KangxiMap(chio.read_tsv_iter(path, fieldnames=True))
+    kmap = KangxiMap()
+    for row in rows:
+        # columns follow KANGXI_FIELDS, no need to build a dict per row
+        kmap.add(_parse_numbers(Radical(*row)))
+    return kmap
@@ -106,15 +106,24 @@ class Tag(DataObject):
 
     def to_dict(self, default_cfrom=-1, default_cto=-1, *args, **kwargs):
         """ Serialize this Tag object data into a dict """
-        a_dict = {'value': self.value}
-        if self.type:
-            a_dict['type'] = self.type
+        a_dict = {'value': self.__value}
+        if self.__type:
+            a_dict['type'] = self.__type
         if self.source:
             a_dict['source'] = self.source
-        if self.cfrom not in (None, -1, default_cfrom, self.parent.cfrom if self.parent else None) and self.cfrom >= 0:
-            a_dict['cfrom'] = self.cfrom
-        if self.cto not in (None, -1, default_cto, self.parent.cto if self.parent else None) and self.cto >= 0:
-            a_dict['cto'] = self.cto
+        cfrom, cto = self.__cfrom, self.__cto
+        keep_cfrom = cfrom is not None and cfrom >= 0 and cfrom != default_cfrom
+        keep_cto = cto is not None and cto >= 0 and cto != default_cto
+        if keep_cfrom or keep_cto:
+            # only look up parent when there is an offset to compare
+            parent = self.parent
+            if parent:
+                keep_cfrom = keep_cfrom and cfrom != parent.cfrom
+                keep_cto = keep_cto and cto != parent.cto
+        if keep_cfrom:
+            a_dict['cfrom'] = cfrom
+        if keep_cto:
+            a_dict['cto'] = cto
         return a_dict
 
     def clone(self, **kwargs):
@@ -149,10 +158,16 @@ class ProtoList:
         self.__release_hook = release_hook  # notify parent that an object has been removed
         self.__taglist_create_hook = taglist_create_hook  # notify parent that TagList created a new object using new()
         self.__children = []
+        self.__positions = None  # id(child) -> position, built by index() and reset when children change
 
     def __len__(self):
         return len(self.__children)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_ProtoList__positions'] = None  # keyed by id(child), not valid in a copy
+        return state
+
     def __iter__(self):
         return iter(self.__children)
 
@@ -169,9 +184,13 @@ class ProtoList:
 
     def __contains__(self, value):
         if self.__has_index:
-            return value in self.__children or value in self.__obj_map
-        else:
-            return value in self.__children
+            # check the key index first to avoid scanning all children for key lookups
+            try:
+                if value in self.__obj_map:
+                    return True
+            except TypeError:
+                pass  # unhashable values can only be children
+        return value in self.__children
 
     def __repr__(self):
         return repr([repr(c) for c in self])
@@ -206,8 +225,18 @@ class ProtoList:
     def insert(self, idx, obj):
         self._add_obj(obj, idx=idx)
 
-    def index(self, *args, **kwargs):
-        return self.__children.index(*args, **kwargs)
+    def index(self, obj, *args, **kwargs):
+        """ Find the position of an object in this list """
+        if args or kwargs:
+            return self.__children.index(obj, *args, **kwargs)
+        if self.__positions is None:
+            positions = {}
+            for idx, child in enumerate(self.__children):
+                positions.setdefault(id(child), idx)
+            self.__positions = positions
+        idx = self.__positions.get(id(obj))
+        # fall back to equality search for objects that are equal to but not the same as a child
+        return idx if idx is not None else self.__children.index(obj)
 
     def _add_obj(self, obj, idx=None, replace=False):
         """ [Internal function] Add an existing object into this list
@@ -221,6 +250,7 @@ class ProtoList:
         """
         if self.__claim_hook:
             self.__claim_hook(obj)
+        self.__positions = None
         if self.__has_index:
             if getattr(obj, self.__proto_key):
                 self.__obj_map[getattr(obj, self.__proto_key)] = obj
@@ -250,9 +280,12 @@ class ProtoList:
             _obj = self.__obj_map[obj_ref]
         else:
             _obj = obj_ref
-        # remove the object from this list
-        if _obj in self.__children:
+        # remove the object from this list (a single scan instead of a membership test + remove)
+        try:
             self.__children.remove(_obj)
+            self.__positions = None
+        except ValueError:
+            pass
         return self._release_obj(_obj)
 
     def _release_obj(self, obj):
@@ -308,6 +341,9 @@ class TagSet(Generic[T]):
 
         def __getattr__(self, type) -> T:
             """ get the first tag object in the tag list of a given type if exist, else return None """
+            if type.startswith('_'):
+                # private & special names are never tag types (e.g. lookups from copy, pickle, or hasattr())
+                raise AttributeError(type)
             return self[type]
 
         def __setattr__(self, type, value):
@@ -352,7 +388,8 @@ class TagSet(Generic[T]):
         self.__parent = parent
         self.__proto_kwargs = kwargs['proto_kwargs'] if 'proto_kwargs' in kwargs else {}
         self.__proto = kwargs['proto'] if 'proto' in kwargs else Tag
-        self.__dict__["_TagSet__tags"] = []
+        # all tags in insertion order, keyed by id() so that removing a tag does not need a list scan
+        self.__dict__["_TagSet__tags"] = {}
         self.__dict__["_TagSet__tagmap"] = TagSet.TagMap(self)
         self.__dict__["_TagSet__tagsmap"] = dict()
 
@@ -365,25 +402,38 @@ class TagSet(Generic[T]):
         """ Number of tags in this object """
         return len(self.__tags)
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # tags are keyed by id(tag), rebuild the keys for the copied tags
+        self.__tags = {id(tag): tag for tag in self.__tags.values()}
+
+    def _track(self, tag):
+        self.__tags[id(tag)] = tag
+
     def __getitem__(self, type) -> T:
         """ Get the all tags of a given type """
         if type not in self.__tagsmap:
             self.__tagsmap[type] = ProtoList(proto=self.__proto,
                                              proto_kwargs={'type': type},
-                                             taglist_create_hook=lambda x: self.__tags.append(x))
+                                             taglist_create_hook=self._track)
         return self.__tagsmap[type]
 
     def __getattr__(self, type) -> T:
         """ Get the first tag of a given type if it exists"""
+        if type.startswith('_'):
+            # do not create tag lists for private & special names, use tagset[type] instead
+            raise AttributeError(type)
         return self[type]
 
     def __contains__(self, type):
         """ Check if there is at least a tag with a type """
-        return type in self.__tagsmap
+        # tag lists are created on access, so an empty list does not count
+        _taglist = self.__tagsmap.get(type)
+        return _taglist is not None and len(_taglist) > 0
 
     def __iter__(self) -> T:
         """ Loop through all tags in this set """
-        return iter(self.__tags)
+        return iter(self.__tags.values())
 
     def items(self):
         """ Return an iterator to loop through all (type, value_list) pairs in this TagSet """
@@ -393,13 +443,12 @@ class TagSet(Generic[T]):
         """ Construct a new tag object and notify parent if possible """
         if self.__proto_kwargs:
             # prioritise values in kwargs rather than in default constructor kwargs
-            for k, v in self.__proto_kwargs.items():
-                if k not in self.kwargs:
-                    kwargs[k] = v
+            kwargs = {**self.__proto_kwargs, **kwargs}
         _tag = self.__proto(*args, **kwargs)
         # TODO to review this _claim book design
-        if self.__parent is not None and self.__parent._claim:
-            self.__parent._claim(_tag)
+        _claim = getattr(self.__parent, '_claim', None) if self.__parent is not None else None
+        if _claim is not None:
+            _claim(_tag)
         return _tag
 
     def new(self, value, type='', *args, **kwargs) -> T:
@@ -415,7 +464,7 @@ class TagSet(Generic[T]):
         General users should NOT use this method as it is very likely to be removed in the future
         """
         self.__map_tag(tag)
-        self.__tags.append(tag)
+        self._track(tag)
         return tag
 
     def __map_tag(self, tag):
@@ -423,8 +472,10 @@ class TagSet(Generic[T]):
         return tag
 
     def _replace_obj(self, old_obj, new_obj):
-        self.__tags.remove(old_obj)
-        self.__tags.append(new_obj)
+        if id(old_obj) not in self.__tags:
+            raise ValueError("This tag object does not exist in this TagSet")
+        del self.__tags[id(old_obj)]
+        self._track(new_obj)
         if old_obj.type == new_obj.type:
             _taglist = self.__tagsmap[old_obj.type]
             _taglist[_taglist.index(old_obj)] = new_obj
@@ -447,19 +498,19 @@ class TagSet(Generic[T]):
         """ Remove a generic tag object and return them """
         if tag is None:
             raise ValueError("Null tag object cannot be popped")
-        elif tag.type not in self:
+        elif id(tag) not in self.__tags:
             raise ValueError("This tag object does not exist in this TagSet")
         else:
             self.__tagsmap[tag.type].remove(tag)
-            self.__tags.remove(tag)
+            del self.__tags[id(tag)]
             return tag
 
     def pop(self, idx: int) -> T:
         """ Remove a tag at a given position and return it """
-        return self.remove(self.__tags[idx])
+        return self.remove(list(self.__tags.values())[idx])
 
     def index(self, obj):
-        return self.__tags.index(obj)
+        return list(self.__tags.values()).index(obj)
 
     def values(self, type=None):
         """ Get all values of tags with the specified type or all tags when type is None """
@@ -477,7 +528,7 @@ class Token(DataObject):
     def __init__(self, text='', cfrom=-1, cto=-1, pos=None, lemma=None, comment=None, flag=None, **kwargs):
         """ A token (e.g. a word in a sentence) """
         super().__init__(**kwargs)
-        self.__tags: TagSet[Tag] = TagSet[Tag](parent=self)
+        self.__tags: TagSet[Tag] = TagSet(parent=self)
         self.cfrom = cfrom
         self.cto = cto
         self.__text = text  # original/surface form
@@ -493,6 +544,8 @@ class Token(DataObject):
         self.tag[name] = value
 
     def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
         return self[name]
 
     def __len__(self):
@@ -557,9 +610,10 @@ class Token(DataObject):
         return tm
 
     def to_dict(self):
-        token_json = {'cfrom': self.cfrom,
-                      'cto': self.cto,
-                      'text': self.text}
+        cfrom, cto = self.cfrom, self.cto
+        token_json = {'cfrom': cfrom,
+                      'cto': cto,
+                      'text': self.__text}
         if self.lemma:
             token_json['lemma'] = self.lemma
         if self.pos:
@@ -568,9 +622,8 @@ class Token(DataObject):
             token_json['comment'] = self.comment
         if self.flag:
             token_json['flag'] = self.flag
-        all_tags = [t.to_dict(default_cfrom=self.cfrom, default_cto=self.cto) for t in self.tags]
-        if all_tags:
-            token_json['tags'] = all_tags
+        if self.__tags:
+            token_json['tags'] = [t.to_dict(cfrom, cto) for t in self.__tags]
         return token_json
 
     @staticmethod
@@ -730,8 +783,8 @@ class Sentence(DataObject):
         super().__init__(text=text, **kwargs)
         self.text = text
         self.ID = ID
-        self.__tags: TagSet[Tag] = TagSet[Tag](parent=self)
-        self.__concepts: TagSet[Concept] = TagSet[Concept](proto=Concept, proto_kwargs={'sent': self})
+        self.__tags: TagSet[Tag] = TagSet(parent=self)
+        self.__concepts: TagSet[Concept] = TagSet(proto=Concept, proto_kwargs={'sent': self})
         self.__tokens: ProtoList = ProtoList(parent=self, proto=Token, proto_kwargs={'sent': self})
         if tokens:
             self.tokens = tokens
@@ -966,7 +1019,12 @@ class Document(DataObject):
 
     def __contains__(self, sent_id):
         """ Check if a given sentence ID exists in this Document """
-        return str(sent_id) in self.__sents
+        # look up the ID index directly, sentence objects can never be equal to an ID string
+        try:
+            self.__sents[str(sent_id)]
+            return True
+        except KeyError:
+            return False
 
     def __len__(self):
         return len(self.__sents)
@@ -1265,12 +1323,10 @@ def read_json_iter(path):
 
 def read_json(path):
     """ Read a TTL Document in TTL-JSON format """
-    if not os.path.isfile(path):
-        raise Exception("Document file could not be found: {}".format(path))
     doc_name = os.path.splitext(os.path.basename(path))[0]
     doc_path = os.path.dirname(path)
     doc = Document(doc_name, path=doc_path)
-    for sent in read_json_iter(path):
+    for sent in read_json_iter(path):  # path is checked when the iteration starts
         doc.sents.append(sent)
     return doc
 
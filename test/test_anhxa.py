@@ -33,6 +33,15 @@ def getLogger():
 # Data Structures
 # -------------------------------------------------------------------------------
 
+class SlottedJob(object):
+
+    __slots__ = ('job', 'sal')
+
+    def __init__(self, job='N/A', sal=0):
+        self.job = job
+        self.sal = sal
+
+
 class PersonifyJSONEncoder(TypedJSONEncoder):
 
     def __init__(self, *args, **kwargs):
@@ -200,6 +209,12 @@ class TestAnhxa(unittest.TestCase):
         p2 = to_obj(Person, p1j, **j2o_map)
         self.assertEqual(p1, p2)
 
+    def test_slots_object(self):
+        j = SlottedJob('pupil', -100)
+        self.assertEqual(to_dict(j), {'job': 'pupil', 'sal': -100})
+        self.assertEqual(to_dict(j, 'sal', sal='salary'), {'salary': -100})
+        self.assertEqual(json.loads(dumps(j)), {'job': 'pupil', 'sal': -100})
+
 
 # -------------------------------------------------------------------------------
 # MAIN
@@ -11,6 +11,7 @@ Script for testing arsenal lib
 
 import os
 import logging
+import tempfile
 import unittest
 
 from chirptext.leutile import LOREM_IPSUM
@@ -57,6 +58,13 @@ class TestArsenal(unittest.TestCase):
         self.try_cache(cache, 1, 'Key is a number')
         self.try_cache(cache, None, 'None key')
 
+    def test_external_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = JiCache(os.path.join(tmpdir, 'cache.db'), use_internal_blob=False)
+            self.try_cache(cache, 'lorem', LOREM_IPSUM)
+            cache.insert_blob('bin', b'\x00\xff')
+            self.assertEqual(cache.retrieve_blob('bin'), b'\x00\xff')
+
 
 ########################################################################
 
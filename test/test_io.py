@@ -99,6 +99,13 @@ class TestIO(unittest.TestCase):
         self.assertEqual(chio.read_file(tmpgzfile, mode='r'), txtz)
         self.assertIsInstance(chio.read_file(tmpfile, mode='rb'), bytes)
         self.assertIsInstance(chio.read_file(tmpgzfile, mode='rb'), bytes)
+        # text written in binary mode keeps its encoding and line endings
+        chio.write_file(tmpfile, 'line 1\nユニコード\n', mode='wb')
+        self.assertEqual(chio.read_file(tmpfile, mode='rb'), 'line 1\nユニコード\n'.encode('utf-8'))
+        chio.write_file(tmpfile, 'ユニコード'.encode('utf-8'))
+        self.assertEqual(chio.read_file(tmpfile), 'ユニコード')
+        chio.write_file(tmpgzfile, 'ユニコード', encoding='utf-8')
+        self.assertEqual(chio.read_file(tmpgzfile), 'ユニコード')
 
 
 class TestUsingCSV(unittest.TestCase):
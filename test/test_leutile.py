@@ -12,10 +12,12 @@ Script for testing leutile
 import os
 import logging
 import unittest
+import tempfile
 from pathlib import Path
+from unittest import mock
 
 from chirptext.leutile import Counter, TextReport, StringTool, LOREM_IPSUM, Timer, piter
-from chirptext.leutile import FileHelper
+from chirptext.leutile import FileHelper, FileHub, Table, is_number, grouper, chunked, uniquify, confirm, header
 from chirptext.leutile import AppConfig
 
 
@@ -49,6 +51,43 @@ class TestLeUtile(unittest.TestCase):
         self.assertEqual(StringTool.detokenize("Note : It works .".split()), "Note: It works.")
         self.assertEqual(StringTool.detokenize("( A ) ; ".split()), "(A);")
         self.assertEqual(StringTool.detokenize("( A ) ; B ".split()), "(A); B")
+        # several rules in one sentence, each rule applies to the output of the previous ones
+        self.assertEqual(StringTool.detokenize("I 'm sure , , you 've seen it : they 're ( not ) here ; we 'd go !".split()),
+                         "I'm sure, you've seen it: they're (not) here; we'd go!")
+        self.assertEqual(StringTool.detokenize("He said `` I do n't know '' .".split()), "He said “I don't know”.")
+        self.assertEqual(StringTool.detokenize([]), "")
+
+    def test_is_number(self):
+        for s in ("1", "-1.5", ".5", "1.", "1e-3", " 12 ", "1_000", "inf", "-Infinity", 3, 2.5):
+            self.assertTrue(is_number(s), s)
+        for s in ("", ".", "e5", "1_", "1__0", "nan", "NaN", "0x10", "abc", None, float('nan')):
+            self.assertFalse(is_number(s), s)
+
+    def test_confirm(self):
+        for answer, expected in (('y', True), ('Yes', True), (' OK\n', True), ('no', False), ('', False)):
+            with mock.patch('builtins.input', return_value=answer):
+                self.assertEqual(confirm("Continue? "), expected)
+
+    def test_header(self):
+        with TextReport.string() as rp:
+            header("Title", 1, level='h0', print_out=rp.print)
+            rp.header("Section")
+            rp.header("Sub", level='h2')
+            rp.header("Subsub", level='h3')
+            self.assertEqual(rp.content().splitlines(),
+                             ['+' + '-' * 82, '| Title 1', '+' + '-' * 82,
+                              '', 'Section', '-' * 60,
+                              '\tSub', '\t' + '-' * 40,
+                              '\t\tSubsub', '\t\t' + '-' * 20])
+
+    def test_uniquify(self):
+        self.assertEqual(uniquify(['b', 'a', 'b', 'c', 'a']), ['b', 'a', 'c'])
+        self.assertEqual(uniquify([]), [])
+
+    def test_chunking(self):
+        self.assertEqual(list(grouper(range(5), 2)), [(0, 1), (2, 3), (4, None)])
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
 
     def test_piter(self):
         p1 = piter(range(5))
@@ -98,6 +137,47 @@ class TestLeUtile(unittest.TestCase):
             getLogger().debug("{}: {}".format(k, v))
         self.assertEqual(top5chars, expected)
 
+    def test_counter_summarise(self):
+        c = Counter()
+        c.update("abracadabra")
+        with TextReport.string() as rp:
+            c.summarise(report=rp, limit=2)
+            self.assertEqual(rp.content(), "a: 5\nb: 2\n")
+        with TextReport.string() as rp:
+            c.summarise(report=rp, byfreq=False, limit=2)
+            self.assertEqual(rp.content(), "a: 5\nb: 2\n")
+        with TextReport.string() as rp:
+            c.summarise(report=rp)
+            self.assertEqual(len(rp.content().splitlines()), 5)
+        # writeline overrides in TextReport subclasses are used
+        class UpperReport(TextReport):
+            def writeline(self, *msg, **kwargs):
+                super().writeline(*(str(x).upper() for x in msg), **kwargs)
+
+        with UpperReport(TextReport.STRINGIO) as rp:
+            c.summarise(report=rp, limit=2)
+            self.assertEqual(rp.content(), "A: 5\nB: 2\n")
+        # any object with a writeline() method can be used as a report
+        lines = []
+        c.summarise(report=mock.Mock(writeline=lines.append), limit=2)
+        self.assertEqual(lines, ["a: 5", "b: 2"])
+
+    def test_counter_group_by_count(self):
+        c = Counter()
+        c.update("abracadabra")
+        self.assertEqual(list(c.group_by_count()), [(5, ['a']), (2, ['b', 'r']), (1, ['c', 'd'])])
+
+    def test_counter_priority(self):
+        c = Counter(priority=['z'])
+        c.update('abz')
+        self.assertEqual(c.priority, ('z',))
+        self.assertEqual(c.get_report_order(), [['z', 1], ['a', 1], ['b', 1]])
+        c.priority = ('b', 'a')
+        self.assertEqual(c.priority, ('b', 'a'))
+        self.assertEqual(c.get_report_order(), [['b', 1], ['a', 1], ['z', 1]])
+        c.priority = None
+        self.assertEqual(c.priority, ())
+
     def test_textreport(self):
         with TextReport.null() as rp:
             rp.writeline("null")
@@ -112,11 +192,65 @@ class TestLeUtile(unittest.TestCase):
             rp.writeline(123)
             self.assertEqual(rp.content(), '')
         self.assertTrue(rp.closed)
+        # buffered output is available after flush()
+        with TextReport(os.path.join(TEST_DATA, "del.me")) as rp:
+            rp.writeline("ABC")
+            rp.flush()
+            with open(rp.path) as infile:
+                self.assertEqual(infile.read(), "ABC\n")
+            # auto_flush can be switched on after the report is created
+            rp.auto_flush = True
+            rp.writeline("DEF")
+            with open(rp.path) as infile:
+                self.assertEqual(infile.read(), "ABC\nDEF\n")
         # test string report
         with TextReport.string() as rp:
             rp.writeline("ABC")
             rp.writeline(123, 456, 789)
             self.assertEqual(rp.content(), 'ABC\n123 456 789\n')
+        with TextReport.string() as rp:
+            rp.writeline("A", "B", separator="-", level=2)
+            rp.print("C")
+            self.assertEqual(rp.content(), '\t\tA-B\nC\n')
+            rp.writelines(["D", 1], level=1)
+            self.assertEqual(rp.content(), '\t\tA-B\nC\n\tD\n\t1\n')
+            # the string stream is a regular file object
+            self.assertEqual(rp.file.write("E\n"), 2)
+            rp.file.seek(0)
+            self.assertEqual(rp.file.read(), '\t\tA-B\nC\n\tD\n\t1\nE\n')
+        with TextReport.string() as rp:
+            rp.write("A", level=1)
+            TextReport.writeline(rp, "B", 2, separator=",")
+            self.assertEqual(rp.content(), '\tAB,2\n')
+
+        # subclasses can override writeline
+        class UpperReport(TextReport):
+            def writeline(self, *msg, **kwargs):
+                super().writeline(*(str(x).upper() for x in msg), **kwargs)
+
+        with UpperReport(TextReport.STRINGIO) as rp:
+            rp.writeline("a", "b")
+            rp.print("c")
+            self.assertEqual(rp.content(), 'A B\nC\n')
+
+    def test_filehub(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with FileHub(working_dir=tmpdir, default_mode='w') as hub:
+                hub['a'].writeline("line A")
+                hub['b'].writeline("line B")
+                hub['a'].writeline("line A2")
+                hub.writeline('b', "line", "B2", separator="-")
+                hub.writeline('c', "line C", level=1)
+                hub.flush()
+                with open(os.path.join(tmpdir, 'b.txt')) as infile:
+                    self.assertEqual(infile.read(), "line B\nline-B2\n")
+                reports = list(hub.files.values())
+            self.assertTrue(all(r.closed for r in reports))
+            self.assertFalse(hub.files)
+            with open(os.path.join(tmpdir, 'a.txt')) as infile:
+                self.assertEqual(infile.read(), "line A\nline A2\n")
+            with open(os.path.join(tmpdir, 'c.txt')) as infile:
+                self.assertEqual(infile.read(), "\tline C\n")
 
     def test_timer(self):
         rp = TextReport.string()
@@ -144,6 +278,116 @@ def do_expensive(n=10000):
     return str(s.content())
 
 
+class TestTable(unittest.TestCase):
+
+    def test_get_column(self):
+        tbl = Table()
+        tbl.add_row(["a", None])
+        tbl.add_row(["b", 2])
+        self.assertEqual(tbl.get_column(0), ["a", "b"])
+        self.assertEqual(tbl.get_column(1), [None, 2])
+        tbl = Table(NoneValue='-')
+        tbl.add_row(["a", None])
+        tbl.add_row(["b", 2])
+        self.assertEqual(tbl.get_column(1), ['-', 2])
+        tbl.add_row(["c"])
+        self.assertEqual(tbl.get_column(0), ["a", "b", "c"])
+        self.assertEqual(tbl.get_column(1), ['-', 2, '-'])
+        self.assertRaises(IndexError, lambda: tbl.get_column(2))
+        # columns follow changes made to the rows directly
+        tbl[0][1] = 99
+        tbl.rows.append(["d", 4])
+        self.assertEqual(tbl.get_column(1), [99, 2, '-', 4])
+        tbl.get_column(1).append(5)
+        self.assertEqual(tbl.get_column(1), [99, 2, '-', 4])
+        self.assertEqual(Table().get_column(0), [])
+
+    def test_add_row(self):
+        tbl = Table(NoneValue='')
+        self.assertRaises(ValueError, lambda: tbl.add_row(None))
+        row = ('a',)
+        tbl.add_row(row)
+        tbl.add_row(['b', 'c', 'd'])
+        tbl.add_row(['e'])
+        self.assertEqual(tbl.rows, [['a', '', ''], ['b', 'c', 'd'], ['e', '', '']])
+        self.assertEqual(row, ('a',))
+
+    def test_get_row(self):
+        tbl = Table()
+        tbl.add_row(["a", 1])
+        self.assertIs(tbl[0], tbl.rows[0])
+        row = tbl.get_row_copy(0)
+        row.append(2)
+        self.assertEqual(row, ["a", 1, 2])
+        self.assertEqual(tbl[0], ["a", 1])
+
+    def test_format(self):
+        tbl = Table()
+        self.assertEqual(tbl.format(), [])
+        tbl.add_row(["Name", "Age"])
+        tbl.add_row(["Alexander", 7])
+        tbl.add_row(["Bo", None])
+        self.assertEqual(tbl.format(), [9, 3])
+        tbl = Table()
+        tbl.add_row([0, ''])
+        self.assertEqual(tbl.format(), [1, 0])
+
+    def test_print(self):
+        tbl = Table()
+        tbl.add_row(["Name", "Age"])
+        tbl.add_row(["Alexander", 17])
+        tbl.add_row(["Bo", 7])
+        with TextReport.string() as rp:
+            tbl.print(print_func=rp.print)
+            self.assertEqual(rp.content(), '+-----------+-----+\n'
+                                           '|    Name   | Age |\n'
+                                           '+-----------+-----+\n'
+                                           '| Alexander |  17 |\n'
+                                           '| Bo        |   7 |\n'
+                                           '+-----------+-----+\n')
+        # missing cells are printed as empty cells
+        tbl = Table()
+        tbl.add_row(["A"])
+        tbl.add_row(["B", "CC"])
+        with TextReport.string() as rp:
+            tbl.print(print_func=rp.print)
+            self.assertEqual(rp.content(), '+---+----+\n'
+                                           '| A |    |\n'
+                                           '+---+----+\n'
+                                           '| B | CC |\n'
+                                           '+---+----+\n')
+        # without padding
+        tbl = Table(header=False, padding=False)
+        tbl.add_row(["A", 1])
+        tbl.add_row(["BB", 22])
+        with TextReport.string() as rp:
+            tbl.print(print_func=rp.print)
+            self.assertEqual(rp.content(), '+--+--+\n'
+                                           '|A | 1|\n'
+                                           '|BB|22|\n'
+                                           '+--+--+\n')
+
+        # print() draws through print_separator() and print_cells()
+        class MarkdownTable(Table):
+            def print_separator(self, print_func):
+                print_func('|' + '|'.join(self._separator_cells()) + '|')
+
+            def print_cells(self, cells, print_func=None, extra_lines=False, joint='|'):
+                if joint == '|':
+                    super().print_cells(cells, print_func, extra_lines, joint)
+
+        tbl = MarkdownTable(padding=False)
+        tbl.add_row(["A", "B"])
+        tbl.add_row(["x", 1])
+        with TextReport.string() as rp:
+            tbl.print(print_func=rp.print)
+            self.assertEqual(rp.content(), '|-|-|\n'
+                                           '|A|B|\n'
+                                           '|-|-|\n'
+                                           '|x|1|\n'
+                                           '|-|-|\n')
+
+
 class TestFileHelper(unittest.TestCase):
 
     def test_replace_ext(self):
@@ -159,6 +403,21 @@ class TestFileHelper(unittest.TestCase):
         self.assertRaises(Exception, lambda: FileHelper.replace_ext('', None))
         self.assertRaises(Exception, lambda: FileHelper.replace_ext((1, 2, 3, 4), None))
 
+    def test_child_items(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.mkdir(os.path.join(tmpdir, 'sub'))
+            Path(tmpdir, 'a.txt').touch()
+            self.assertEqual(FileHelper.get_child_folders(tmpdir), ['sub'])
+            self.assertEqual(FileHelper.get_child_files(tmpdir), ['a.txt'])
+            FileHelper.remove_file(os.path.join(tmpdir, 'a.txt'))
+            FileHelper.remove_file(os.path.join(tmpdir, 'a.txt'))  # missing files are ignored
+            self.assertEqual(FileHelper.get_child_files(tmpdir), [])
+
+    def test_getfilename(self):
+        self.assertEqual(FileHelper.getfilename('/data/foo.tar.gz'), 'foo.tar')
+        self.assertEqual(FileHelper.getfilename('/data/foo.tar.gz'), 'foo.tar')
+        self.assertEqual(FileHelper.getfilename(Path('data/bar.txt')), 'bar')
+
     def test_rename(self):
         self.assertEqual(Path(FileHelper.replace_name('/data/foo.xml', 'bar')),
                          Path('/data/bar.xml'))
@@ -186,9 +445,14 @@ class TestConfigFile(unittest.TestCase):
                     './data/foo', './data/.foo', '~/.config/foo', '~/.config/.foo',
                     '~/.foo', '~/.foo/config', '~/.config/foo/config', '~/.config/foo/foo']
         self.assertEqual(actual, expected)
+        # duplicated patterns are only checked once
+        cfg = AppConfig(name='foo', mode=AppConfig.JSON, extra_potentials=['{wd}/.{n}.{mode}', '/tmp/{n}.{mode}'])
+        self.assertEqual(cfg.potentials(), ['./.foo.json', '/tmp/foo.json'] + expected[1:])
         # default mode is INI
         cfg_ini = AppConfig('chirptest', working_dir=os.path.dirname(__file__))
         self.assertEqual(cfg_ini.config.sections(), ['AUTHOR'])
+        self.assertEqual(cfg_ini.locate_config(), cfg_ini.config_path)
+        self.assertEqual(cfg_ini.locate_config(), cfg_ini.config_path)
         self.assertEqual(cfg_ini.config['DEFAULT']['package'], 'chirptext.test')
         self.assertEqual(cfg_ini.config['DEFAULT']['tester'], 'unittest')
         self.assertEqual(cfg_ini.config['AUTHOR']['name'], 'Le Tuan Anh')
@@ -200,6 +464,31 @@ class TestConfigFile(unittest.TestCase):
             cfg_ini.config.write(strfile.file)
             self.assertIn('desc = An author', strfile.content())
         # use JSON
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'foo.json'), 'w', encoding='utf-8') as outfile:
+                outfile.write('{"name": "ユニコード", "tester": "unittest"}')
+            cfg_json = AppConfig('foo', mode=AppConfig.JSON, working_dir=tmpdir)
+            self.assertEqual(cfg_json.config, {"name": "ユニコード", "tester": "unittest"})
+            # a config file with higher priority is found once it is created
+            with open(os.path.join(tmpdir, '.foo.json'), 'w', encoding='utf-8') as outfile:
+                outfile.write('{}')
+            self.assertEqual(cfg_json.locate_config(), os.path.join(tmpdir, '.foo.json'))
+            # relative locations follow the current working directory
+            cfg_cwd = AppConfig('foo', mode=AppConfig.JSON)
+            cwd = os.getcwd()
+            try:
+                with tempfile.TemporaryDirectory() as tmpdir2:
+                    with open(os.path.join(tmpdir2, 'foo.json'), 'w', encoding='utf-8') as outfile:
+                        outfile.write('{}')
+                    os.chdir(tmpdir)
+                    self.assertEqual(cfg_cwd.locate_config(), os.path.join(os.path.realpath(tmpdir), '.foo.json'))
+                    os.chdir(tmpdir2)
+                    self.assertEqual(cfg_cwd.locate_config(), os.path.join(os.path.realpath(tmpdir2), 'foo.json'))
+            finally:
+                os.chdir(cwd)
+            # a missing INI file gives an empty config
+            cfg_ini.load(os.path.join(tmpdir, 'missing.ini'))
+            self.assertEqual(cfg_ini.config.sections(), [])
 
 
 # ------------------------------------------------------------------------------
@@ -35,6 +35,15 @@ class TestLuke(unittest.TestCase):
         self.assertEqual(len(sr), 100)
         self.assertEqual(len(ss), 100)
         self.assertEqual(repr(s71[0]), "Word(ID=1, word='I')")
+        self.assertEqual(s71[0].description, '(Pers.Pron.1.Sg.)')
+        self.assertEqual((sr[0].ID, sr[0].word, sr[0].score, sr[0].rank), ('22', 'louse', '42.8', 1))
+        self.assertFalse(hasattr(ss[0], '__dict__'))
+        # parsed lists are cached, but each call returns a new list
+        s71_2 = read_swadesh_1971()
+        self.assertIsNot(s71, s71_2)
+        self.assertIs(s71[0], s71_2[0])
+        s71_2.clear()
+        self.assertEqual(len(read_swadesh_1971()), 100)
         # are they the same words?
         s71_words = {w.word for w in s71}
         sr_words = {w.word for w in sr}
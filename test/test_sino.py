@@ -10,8 +10,11 @@ Test script for sino module
 # :license: MIT, see LICENSE for more details.
 
 import os
+import json
 import unittest
-from chirptext.sino import Radical, KangxiMap
+import tempfile
+from chirptext.anhxa import dumps
+from chirptext.sino import Radical, KangxiMap, _read_kangxi
 
 TEST_DIR = os.path.dirname(os.path.realpath(__file__))
 TEST_DATA = os.path.join(TEST_DIR, 'data')
@@ -22,12 +25,50 @@ class TestSino(unittest.TestCase):
     def test_sino_model(self):
         km = KangxiMap()
         self.assertEqual(len(km), 0)
+        self.assertEqual(km.all, [])
+        self.assertEqual(km.strokes, {})
+        km.add(Radical(idseq=1, radical='一', strokes=1, meaning='one'))
+        km.add(Radical(idseq=2, radical='丨', strokes=1, meaning='line'))
+        self.assertEqual(km.all, ['一', '丨'])
+        self.assertIs(km.all, km.all)
+        self.assertEqual(km.strokes, {1: ['一', '丨']})
+        km.add(Radical(idseq=7, radical='二', strokes=2, meaning='two'))
+        self.assertEqual(km.all, ['一', '丨', '二'])
+        self.assertEqual(km.strokes, {1: ['一', '丨'], 2: ['二']})
+
+    def test_kangxi_map_from_rows(self):
+        rows = [{'idseq': '1', 'radical': '一', 'strokes': '1', 'frequency': '42', 'meaning': 'one', 'note': 'extra column'},
+                {'idseq': '2', 'radical': '丨', 'strokes': '1', 'frequency': '21', 'variants': '〡'}]
+        km = KangxiMap(rows)
+        self.assertEqual(len(km), 2)
+        self.assertEqual(km['1'].meaning, 'one')
+        self.assertEqual(km['1'].strokes, 1)
+        self.assertEqual(km['〡'].idseq, 2)
+        self.assertEqual(km['丨'].meaning, '')
+        self.assertNotIn('3', km)
+        self.assertEqual(km[0].meaning, 'one')  # by list index
+        # literal matching takes priority over idseq
+        km.add(Radical(idseq=3, radical='2', strokes=1))
+        self.assertEqual(km['2'].idseq, 3)
+        self.assertEqual(km.id_rad_map['2'].idseq, 2)
+        self.assertIn('3', km)
+
+    def test_read_kangxi_columns(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'kangxi.tsv')
+            with open(path, 'w', encoding='utf-8') as outfile:
+                outfile.write('radical\tidseq\tstrokes\tfrequency\tmeaning\n一\t1\t1\t42\tone\n')
+            km = _read_kangxi(path)
+        self.assertEqual(km['1'].radical, '一')
+        self.assertEqual(km['一'].to_dict()['strokes'], 1)
 
     def test_rad_string(self):
         rads = Radical.kangxi()
         黃 = rads['黃']
         self.assertEqual(str(黃), '黃-yellow[sc:12]')
         self.assertEqual(repr(黃), '黃-yellow[sc:12]')
+        self.assertFalse(hasattr(黃, '__dict__'))
+        self.assertEqual(json.loads(dumps(黃))['meaning'], 'yellow')
         
     def test_sino(self):
         rads = Radical.kangxi()
@@ -9,10 +9,12 @@ Latest version can be found at https://github.com/letuananh/chirptext
 :copyright: (c) 2012 Le Tuan Anh <tuananh.ke@gmail.com>
 :license: MIT, see LICENSE for more details.
 """
+import copy
 import io
 import json
 import logging
 import os
+import pickle
 import unittest
 from pathlib import Path
 
@@ -100,6 +102,86 @@ class TestBasicModel(unittest.TestCase):
                     "cat-n-2", "cat-n-3", "cat-n-4"}
         self.assertEqual(expected, actual)
 
+    def test_tagset_remove_replace(self):
+        tags = ttl.TagSet()
+        t1 = tags.new("NN", "pos")
+        t2 = tags.new("cat-n-1", "sense")
+        t3 = tags.pos.new("NNP")
+        self.assertEqual(list(tags), [t1, t2, t3])
+        self.assertEqual(tags.index(t3), 2)
+        # replaced tags are moved to the end
+        t4 = tags.replace(t1, "VB", "pos")
+        self.assertEqual(list(tags), [t2, t3, t4])
+        self.assertEqual(list(tags.pos), [t4, t3])
+        self.assertIs(tags.pop(-1), t4)
+        self.assertIs(tags.remove(t2), t2)
+        self.assertEqual(list(tags), [t3])
+        self.assertEqual(len(tags.sense), 0)
+        self.assertRaises(IndexError, lambda: tags.pop(1))
+        # tags from another TagSet cannot be removed or replaced
+        other = ttl.TagSet()
+        t5 = other.new("NNP", "pos")
+        self.assertRaises(ValueError, lambda: tags.remove(t5))
+        self.assertRaises(ValueError, lambda: tags.replace(t5, "NN", "pos"))
+        self.assertEqual(list(tags), [t3])
+        self.assertEqual(list(tags.pos), [t3])
+        self.assertEqual(list(other), [t5])
+
+    def test_protolist_index(self):
+        sent = ttl.Sentence("a b c d")
+        sent.tokens = "a b c d".split()
+        a, b, c, d = sent.tokens
+        self.assertEqual([sent.tokens.index(t) for t in (a, b, c, d)], [0, 1, 2, 3])
+        sent.tokens.remove(b)
+        self.assertEqual(sent.tokens.index(c), 1)
+        self.assertRaises(ValueError, lambda: sent.tokens.index(b))
+        sent.tokens.insert(0, b)
+        self.assertEqual(sent.tokens.index(d), 3)
+        e = ttl.Token("e")
+        sent.tokens[1] = e
+        self.assertEqual(sent.tokens.index(e), 1)
+        self.assertEqual(sent.tokens.index(d, 2), 3)
+        c1 = sent.concepts.new("c1", tokens=[b, d])
+        self.assertEqual(c1.to_dict()['tokens'], [0, 3])
+
+    def test_tagset_proto_kwargs(self):
+        sent = ttl.Sentence("a b")
+        sent.tokens = "a b".split()
+        c1 = sent.concepts.new("c1", "wn", tokens=[0])
+        self.assertIs(c1.sent, sent)
+        self.assertEqual([t for t, _ in sent.concepts.items()], ["wn"])
+        # explicit kwargs take priority over the default constructor kwargs
+        other = ttl.Sentence("c")
+        c2 = sent.concepts.new("c2", "wn", sent=other)
+        self.assertIs(c2.sent, other)
+
+    def test_special_attrs(self):
+        tags = ttl.TagSet()
+        self.assertFalse(hasattr(tags, '__foo__'))
+        self.assertFalse(hasattr(tags.gold, '_bar'))
+        self.assertEqual(len(list(tags.items())), 0)
+        # reading a tag type must not block get_or_create
+        self.assertEqual(len(tags.pos), 0)
+        self.assertNotIn('pos', tags)
+        self.assertEqual(tags.gold.get_or_create('pos').type, 'pos')
+        self.assertIn('pos', tags)
+        tok = ttl.Token("cat")
+        self.assertRaises(AttributeError, lambda: tok._foo)
+        self.assertIsNone(tok.sense)
+
+    def test_copy_sent(self):
+        sent = ttl.Sentence("I like cats.")
+        sent.tokens = "I like cats .".split()
+        sent[2].tags.new("cat-n-1", "sense")
+        sent.concepts.new("cat-n-1", "wn", tokens=[2])
+        self.assertEqual(sent.tokens.index(sent[2]), 2)
+        for sent2 in (copy.deepcopy(sent), pickle.loads(pickle.dumps(sent))):
+            self.assertEqual(sent2.to_dict(), sent.to_dict())
+            self.assertEqual(sent2.tokens.index(sent2[2]), 2)
+            sent2[2].tags.remove(sent2[2].tags.gold.sense)
+            self.assertEqual(len(sent2[2].tags), 0)
+            self.assertEqual(len(sent[2].tags), 1)
+
     def test_comparing_token_list(self):
         set1 = ttl.TokenList()
         set2 = ttl.TokenList()
@@ -153,6 +235,12 @@ class TestBasicModel(unittest.TestCase):
         tag_json = {'value': 'foo', 'source': '頭', 'type': '冗談', 'cfrom': 0, 'cto': 3}
         tag_new = ttl.Tag.from_dict(tag_json)
         self.assertEqual(tag_json, tag_new.to_dict())
+        # offsets that are the same as the defaults or the parent's are dropped
+        self.assertEqual(tag_new.to_dict(0, 3), {'value': 'foo', 'source': '頭', 'type': '冗談'})
+        self.assertEqual(tag_new.to_dict(0), {'value': 'foo', 'source': '頭', 'type': '冗談', 'cto': 3})
+        parent = ttl.Tag('bar', cfrom=1, cto=3)
+        tag_new = ttl.Tag.from_dict(dict(tag_json, parent=parent))
+        self.assertEqual(tag_new.to_dict(), {'value': 'foo', 'source': '頭', 'type': '冗談', 'cfrom': 0})
 
     def test_get_or_create(self):
         ts = ttl.TagSet()
@@ -268,6 +356,14 @@ class TestBuildTags(unittest.TestCase):
         self.assertEqual(moo.ID, "4")
         sids = [s.ID for s in doc]
         self.assertEqual(sids, ["3", "1", "2", "4"])
+        self.assertIn(3, doc)
+        self.assertIn("4", doc)
+        self.assertNotIn(5, doc)
+        self.assertIn("4", doc.sents)
+        self.assertIn(moo, doc.sents)
+        doc.sents.remove("4")
+        self.assertNotIn("4", doc)
+        self.assertNotIn(moo, doc.sents)
 
 
 class TestComment(unittest.TestCase):